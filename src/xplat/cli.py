@@ -5,6 +5,7 @@ Only CLI code should be in this module, input and output for the user.
 TODO: add logging, verbosity
 """
 
+import os
 from pathlib import Path
 from typing import Annotated
 
@@ -316,8 +317,11 @@ def rename(
         rename_list([source], output_dir, dry_run, style)
         return
 
-    # Directory mode: collect matching files
-    files = [item for item in source.iterdir() if item.is_file() and (ext is None or item.suffix == f".{ext}")]
+    # Directory mode: collect matching files (DirEntry.is_file() avoids a stat call per entry)
+    with os.scandir(source) as entries:
+        files = [
+            Path(entry.path) for entry in entries if entry.is_file() and (ext is None or Path(entry.name).suffix == f".{ext}")
+        ]
 
     # Only show file listing if in interactive mode or dry run
     if interactive and not dry_run:
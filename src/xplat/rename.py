@@ -21,9 +21,14 @@ or
 https://www.ietf.org/rfc/rfc1738.txt
 """
 
+import functools
+import os
 import re
+import stat
+from collections.abc import Callable, Iterable
 from enum import Enum
 from pathlib import Path
+from typing import NamedTuple
 
 
 class Style(str, Enum):
@@ -35,52 +40,178 @@ class Style(str, Enum):
     camel = "camel"
 
 
+# Code points matched by r"\s" (str.isspace), plus the null byte
+_WS_CODEPOINTS = (
+    0x00,
+    *range(0x09, 0x0E),
+    *range(0x1C, 0x21),
+    0x85,
+    0xA0,
+    0x1680,
+    *range(0x2000, 0x200B),
+    0x2028,
+    0x2029,
+    0x202F,
+    0x205F,
+    0x3000,
+)
+_WS_TABLE = dict.fromkeys(_WS_CODEPOINTS, ord(" "))
+
+
 def _normalize_whitespace(name: str) -> str:
     """Normalize all Unicode whitespace to ASCII space, strip null bytes, then strip."""
-    name = name.replace("\x00", " ")
-    return re.sub(r"\s", " ", name).strip()
+    return name.translate(_WS_TABLE).strip()
+
+
+# Byte-level ASCII lowercase: maps A-Z to a-z and every other byte to itself
+_LOWER_TABLE = bytes(i | 0x20 if 0x41 <= i <= 0x5A else i for i in range(256))
+
 
+def _ascii_xlate(delim: str, convert_set: frozenset[str], allowed_set: frozenset[str]) -> tuple[bytes, bytes]:
+    """Build a delimiter style's bytes.translate() arguments for ASCII stems.
 
-def _apply_delimiter_style(name: str, delim: str, convert_chars: str) -> str:
+    The table lowercases A-Z and maps convert characters to the delimiter;
+    the delete bytes are everything else that is not alphanumeric or allowed.
+    """
+    table = bytearray(_LOWER_TABLE)
+    for ch in convert_set:
+        table[ord(ch)] = ord(delim)
+    keep = convert_set | allowed_set
+    delete = bytes(i for i in range(128) if not (chr(i).isalnum() or chr(i) in keep))
+    return bytes(table), delete
+
+
+def _safe_pattern(delim: str, allowed_set: frozenset[str]) -> re.Pattern[str]:
+    """Match stems a delimiter style would leave unchanged: no uppercase, no stray or doubled delimiters."""
+    extra = re.escape("".join(sorted(allowed_set - {delim})))
+    word = f"[a-z0-9{extra}]+"
+    return re.compile(f"{word}(?:{re.escape(delim)}{word})*")
+
+
+class _DelimiterConfig(NamedTuple):
+    """Per-style values precomputed for _apply_delimiter_style (field names match its parameters)."""
+
+    delim: str
+    convert_set: frozenset[str]
+    allowed_set: frozenset[str]
+    double: str
+    collapse: re.Pattern[str]
+    safe: re.Pattern[str]
+    xlate: tuple[bytes, bytes]
+
+
+def _style_config(delim: str, convert_chars: str) -> _DelimiterConfig:
+    """Precompute everything a delimiter style needs from its delimiter and convert characters."""
+    convert_set = frozenset(convert_chars) | {delim}
+    # Keep only alphanumeric + delimiter (web also keeps underscores)
+    allowed_set = frozenset({delim} | ({"_"} if delim == "-" and "_" not in convert_chars else set()))
+    return _DelimiterConfig(
+        delim=delim,
+        convert_set=convert_set,
+        allowed_set=allowed_set,
+        double=delim + delim,
+        collapse=re.compile(f"{re.escape(delim)}{{2,}}"),
+        safe=_safe_pattern(delim, allowed_set),
+        xlate=_ascii_xlate(delim, convert_set, allowed_set),
+    )
+
+
+# Style config, built once per delimiter style
+_STYLE_CONFIG: dict[Style, _DelimiterConfig] = {
+    Style.web: _style_config("-", " ."),  # keep hyphens, keep underscores
+    Style.snake: _style_config("_", " .-"),  # convert everything to underscore
+    Style.kebab: _style_config("-", " ._"),  # convert everything to hyphen
+}
+
+
+def _apply_delimiter_style(
+    name: str,
+    delim: str,
+    convert_set: frozenset[str],
+    allowed_set: frozenset[str],
+    double: str,
+    collapse: re.Pattern[str],
+    safe: re.Pattern[str],
+    xlate: tuple[bytes, bytes],
+) -> str:
     """Apply a delimiter-based style: replace chars, filter, collapse, strip.
 
+    ASCII stems are lowercased, converted and filtered by one bytes.translate()
+    call; other stems are transformed in a single scan that collapses
+    delimiter runs as it goes.
+
     Args:
         name: Pre-normalized filename stem
         delim: The delimiter character ("-" or "_")
-        convert_chars: Characters to convert to the delimiter (e.g., " ._" or " .-")
+        convert_set: Characters converted to the delimiter, including the delimiter itself
+        allowed_set: Non-alphanumeric characters kept in the result
+        double: The delimiter repeated twice
+        collapse: Pattern matching runs of two or more delimiters
+        safe: Pattern matching stems the style leaves unchanged
+        xlate: bytes.translate() table and delete bytes for ASCII stems
     """
-    result = name.lower()
-    for ch in convert_chars:
-        result = result.replace(ch, delim)
-    # Keep only alphanumeric + delimiter (web also keeps underscores via allowed_extra)
-    allowed = {delim} | ({"_"} if delim == "-" and "_" not in convert_chars else set())
-    result = "".join(c for c in result if c.isalnum() or c in allowed)
-    double = delim + delim
-    while double in result:
-        result = result.replace(double, delim)
-    return result.strip(delim)
+    if safe.fullmatch(name):
+        # Already safe (e.g. re-running on renamed files): nothing to transform
+        return name
+
+    if name.isascii():
+        result = name.encode("ascii").translate(*xlate).decode("ascii")
+        # Collapse delimiter runs in one linear pass; the substring test skips the regex when there are none
+        if double in result:
+            result = collapse.sub(delim, result)
+        return result.strip(delim)
+
+    out: list[str] = []
+    # Bind methods once instead of looking them up per character
+    append = out.append
+    isalnum = str.isalnum
+    prev_delim = True  # suppresses leading delimiters
+    for c in name.lower():
+        if c in convert_set:
+            if not prev_delim:
+                append(delim)
+                prev_delim = True
+        elif isalnum(c) or c in allowed_set:
+            append(c)
+            prev_delim = False
+    if out and out[-1] == delim:
+        out.pop()
+    return "".join(out)
+
+
+# Camel style separators, and what is dropped before splitting on them: non-alphanumeric
+# ASCII bytes for the translate fast path, or any such character (\w is isalnum() plus "_")
+_CAMEL_SEPARATORS = " .-_"
+_CAMEL_ASCII_DELETE = bytes(i for i in range(128) if not (chr(i).isalnum() or chr(i) in _CAMEL_SEPARATORS))
+_CAMEL_DROP_RE = re.compile(r"[^\w .\-]+")
+_CAMEL_SPLIT_RE = re.compile(r"[ .\-_]+")
 
 
 def _apply_camel(name: str) -> str:
     """Camel style: remove separators, produce camelCase."""
-    parts = re.split(r"[ .\-_]+", name)
-    clean_parts = [cleaned for part in parts if (cleaned := "".join(c for c in part if c.isalnum()))]
-    if not clean_parts:
-        return ""
-    return clean_parts[0].lower() + "".join(p.title() for p in clean_parts[1:])
+    if name.isascii():
+        cleaned = name.encode("ascii").translate(None, _CAMEL_ASCII_DELETE).decode("ascii")
+    else:
+        cleaned = _CAMEL_DROP_RE.sub("", name)
+    # Stripped separators leave no empty parts; an empty name splits to [""]
+    first, *rest = _CAMEL_SPLIT_RE.split(cleaned.strip(_CAMEL_SEPARATORS))
+    return first.lower() + "".join(p.title() for p in rest)
 
 
-# Style config: (delimiter, characters to convert to delimiter)
-_STYLE_CONFIG: dict[Style, tuple[str, str]] = {
-    Style.web: ("-", " ."),  # keep hyphens, keep underscores
-    Style.snake: ("_", " .-"),  # convert everything to underscore
-    Style.kebab: ("-", " ._"),  # convert everything to hyphen
+# Style dispatch: one callable per style, delimiter styles pre-bound to their config
+_STYLE_FUNCS: dict[Style, Callable[[str], str]] = {
+    **{style: functools.partial(_apply_delimiter_style, **cfg._asdict()) for style, cfg in _STYLE_CONFIG.items()},
+    Style.camel: _apply_camel,
 }
 
 
+@functools.lru_cache(maxsize=4096)
 def safe_stem(name: str, style: Style = Style.web, *, max_bytes: int = 255) -> str:
     """Transform a filename stem to be platform and web-friendly.
 
+    Results are memoized, since dry runs and retries transform the same stems
+    again. Long-running callers can release the cache with safe_stem.cache_clear().
+
     Args:
         name: Original filename stem
         style: Naming style (default: web)
@@ -92,17 +223,73 @@ def safe_stem(name: str, style: Style = Style.web, *, max_bytes: int = 255) -> s
     normalized = _normalize_whitespace(name)
     if not normalized:
         return ""
-    if style == Style.camel:
-        result = _apply_camel(normalized)
-    else:
-        delim, convert_chars = _STYLE_CONFIG[style]
-        result = _apply_delimiter_style(normalized, delim, convert_chars)
+    result = _STYLE_FUNCS[style](normalized)
     # Truncate to stay within filesystem NAME_MAX limit
     while len(result.encode("utf-8")) > max_bytes:
         result = result[:-1]
     return result.rstrip("-_")
 
 
+def safe_stems(names: Iterable[str], style: Style = Style.web, *, max_bytes: int = 255) -> list[str]:
+    """Transform a batch of filename stems, as safe_stem() does for one.
+
+    Args:
+        names: Original filename stems
+        style: Naming style applied to every stem (default: web)
+        max_bytes: Maximum byte length for each result (default: NAME_MAX)
+
+    Returns:
+        Transformed stems, in the same order as names.
+    """
+    return [safe_stem(name, style, max_bytes=max_bytes) for name in names]
+
+
+def _split_name(name: str) -> tuple[str, str]:
+    """Split a file name into (stem, suffix), matching PurePath.stem and PurePath.suffix."""
+    i = name.rfind(".")
+    if 0 < i < len(name) - 1:
+        return name[:i], name[i:]
+    return name, ""
+
+
+def _safe_name(name: str, style: Style) -> str:
+    """Build the safe file name (stem + lowercased suffix) for an original file name."""
+    stem, suffix = _split_name(name)
+    suffix = suffix.lower()
+    new_stem = safe_stem(stem, style, max_bytes=255 - len(suffix.encode("utf-8")))
+    if not new_stem:
+        raise ValueError(f"Filename produces empty stem after sanitization: {name}")
+    return new_stem + suffix
+
+
+def make_safe_paths(
+    entries: Iterable[os.DirEntry[str]],
+    target_dir: Path | None = None,
+    style: Style = Style.web,
+) -> list[tuple[str, str]]:
+    """Create safe file paths for a batch of directory entries, e.g. from os.scandir().
+
+    Works on the entries' pre-split names and paths, without building a Path per file.
+
+    Args:
+        entries: Directory entries to rename
+        target_dir: Optional target directory for the new paths
+        style: Naming style (default: web)
+
+    Returns:
+        (original path, new path) string pairs, in the same order as entries
+
+    Raises:
+        ValueError: If an entry's name produces an empty stem
+    """
+    target = os.fspath(target_dir) if target_dir else None
+    pairs = []
+    for entry in entries:
+        parent = target or os.path.dirname(entry.path)  # noqa: PTH120
+        pairs.append((entry.path, os.path.join(parent, _safe_name(entry.name, style))))  # noqa: PTH118
+    return pairs
+
+
 def make_safe_path(
     orig_path: Path,
     target_dir: Path | None = None,
@@ -118,13 +305,11 @@ def make_safe_path(
     Returns:
         New Path with safe filename in original or target directory
     """
-    suffix = orig_path.suffix.lower()
-    suffix_bytes = len(suffix.encode("utf-8"))
-    stem = safe_stem(orig_path.stem, style, max_bytes=255 - suffix_bytes)
-    if not stem:
-        raise ValueError(f"Filename produces empty stem after sanitization: {orig_path.name}")
-    new_name = stem + suffix
-    return target_dir.joinpath(new_name) if target_dir else orig_path.with_name(new_name)
+    # Work on the path string and build a single Path at the end
+    orig_str = os.fspath(orig_path)
+    new_name = _safe_name(os.path.basename(orig_str), style)  # noqa: PTH119
+    parent = os.fspath(target_dir) if target_dir else os.path.dirname(orig_str)  # noqa: PTH120
+    return Path(os.path.join(parent, new_name))  # noqa: PTH118
 
 
 def rename_file(
@@ -150,9 +335,14 @@ def rename_file(
         FileExistsError: If target path already exists (unless dry_run=True)
         OSError: If original path is a symlink
     """
-    if orig_path.is_symlink():
+    # One lstat() answers both "is it a symlink?" and "is it a regular file?"
+    try:
+        orig_stat = os.lstat(orig_path)
+    except (FileNotFoundError, NotADirectoryError):
+        raise FileNotFoundError(f"Not a file: {orig_path}") from None
+    if stat.S_ISLNK(orig_stat.st_mode):
         raise OSError(f"Refusing to operate on symlink: {orig_path}")
-    if not orig_path.is_file():
+    if not stat.S_ISREG(orig_stat.st_mode):
         raise FileNotFoundError(f"Not a file: {orig_path}")
     if target_dir and not target_dir.is_dir():
         raise NotADirectoryError(f"Not a directory: {target_dir}")
@@ -163,7 +353,13 @@ def rename_file(
     if str(new_path) == str(orig_path):
         return orig_path
 
-    if new_path.exists() and not orig_path.samefile(new_path):
+    # lstat() also sees dangling symlinks, which rename() would silently replace;
+    # samestat() still allows case-only renames on case-insensitive filesystems
+    try:
+        new_stat: os.stat_result | None = os.lstat(new_path)
+    except FileNotFoundError:
+        new_stat = None
+    if new_stat is not None and not os.path.samestat(orig_stat, new_stat):
         if dry_run:
             raise FileExistsError(f"Target already exists: {new_path}")
         raise FileExistsError(f"File already exists: {new_path}")
@@ -1,5 +1,8 @@
 """Tests for the rename module functionality."""
 
+import os
+from pathlib import Path
+
 import pytest
 
 from xplat import rename
@@ -53,6 +56,18 @@ def test_safe_stem_unicode_narrow_nbsp():
     assert rename.safe_stem("Screenshot\u202f2024-01-15") == "screenshot-2024-01-15"
 
 
+def test_safe_stem_non_ascii_letters():
+    """Non-ASCII letters are kept while punctuation is filtered."""
+    assert rename.safe_stem("Café Ünïcode!") == "café-ünïcode"
+    assert rename.safe_stem("Café Ünïcode!", style=Style.snake) == "café_ünïcode"
+
+
+def test_safe_stem_non_ascii_collapses_delims():
+    """Delimiter runs are collapsed and stripped in non-ASCII stems."""
+    assert rename.safe_stem("--é" + "-" * 1000 + "!-b--") == "é-b"
+    assert rename.safe_stem("Ünï . _ -Code", style=Style.kebab) == "ünï-code"
+
+
 # --- Hyphen preservation tests (#18) ---
 
 
@@ -89,6 +104,13 @@ def test_safe_stem_camel():
     assert rename.safe_stem("My File.v2", style=Style.camel) == "myFileV2"
 
 
+def test_safe_stem_camel_drops_punctuation():
+    """Camel style drops punctuation inside and between words."""
+    assert rename.safe_stem("My (Final) File!", style=Style.camel) == "myFinalFile"
+    assert rename.safe_stem("-- ! draft_copy", style=Style.camel) == "draftCopy"
+    assert rename.safe_stem("Café ! Ünïcode", style=Style.camel) == "caféÜnïcode"
+
+
 # --- Edge case tests ---
 
 
@@ -102,6 +124,12 @@ def test_safe_stem_consecutive_delims():
     assert rename.safe_stem("a---b") == "a-b"
 
 
+def test_safe_stem_long_delimiter_run():
+    """Very long delimiter runs collapse to a single delimiter."""
+    assert rename.safe_stem("a" + "-" * 100_000 + "b") == "a-b"
+    assert rename.safe_stem("a" + " ." * 50_000 + "b", style=Style.snake) == "a_b"
+
+
 def test_safe_stem_empty_string():
     """Empty string returns empty string."""
     assert rename.safe_stem("") == ""
@@ -112,6 +140,24 @@ def test_safe_stem_all_special_chars():
     assert rename.safe_stem("!!!") == ""
 
 
+def test_safe_stem_cached():
+    """Repeated stems are served from the cache, which can be cleared."""
+    rename.safe_stem.cache_clear()
+    assert rename.safe_stem("Cached Name") == "cached-name"
+    assert rename.safe_stem("Cached Name") == "cached-name"
+    assert rename.safe_stem.cache_info().hits == 1
+    rename.safe_stem.cache_clear()
+    assert rename.safe_stem.cache_info().currsize == 0
+
+
+def test_safe_stems_matches_safe_stem():
+    """Batch transformation gives the same results as per-name calls, in order."""
+    names = ["My File.v2", "already-safe", "Too--Many---Delims", "!!!", "Café Ünïcode!"]
+    for style in Style:
+        assert rename.safe_stems(names, style) == [rename.safe_stem(name, style) for name in names]
+    assert rename.safe_stems(iter(["A", "B"])) == ["a", "b"]
+
+
 # --- make_safe_path with style ---
 
 
@@ -146,6 +192,33 @@ def test_make_safe_path_with_style(test_dirs):
     assert safe_path.name == "testFile.txt"
 
 
+def test_make_safe_paths(test_dirs, test_files):
+    """Batch path creation matches make_safe_path for each directory entry."""
+    test_path, target_dir = test_dirs
+    (test_path / "Makefile").touch()
+    with os.scandir(test_path) as it:
+        entries = sorted((entry for entry in it if entry.is_file()), key=lambda entry: entry.name)
+
+    pairs = rename.make_safe_paths(entries, style=Style.snake)
+    assert pairs == [(entry.path, str(rename.make_safe_path(test_path / entry.name, style=Style.snake))) for entry in entries]
+    assert [Path(new).name for _, new in pairs] == [
+        "another_complex_file_name.txt",
+        "makefile",
+        "space_to_delim_test_file.txt",
+    ]
+
+    pairs = rename.make_safe_paths(entries, target_dir)
+    assert all(Path(new).parent == target_dir for _, new in pairs)
+
+
+def test_make_safe_paths_empty_stem_raises(test_dirs):
+    """Batch path creation raises ValueError for names that produce empty stems."""
+    test_path, _ = test_dirs
+    (test_path / "!!!.txt").touch()
+    with os.scandir(test_path) as it, pytest.raises(ValueError, match="empty stem"):
+        rename.make_safe_paths(entry for entry in it if entry.is_file())
+
+
 def test_rename_file_errors(test_dirs, test_files):
     """Test error conditions for rename_file."""
     test_path, target_dir = test_dirs
@@ -182,6 +255,26 @@ def test_rename_file_rejects_symlink(test_dirs):
         rename.rename_file(symlink)
 
 
+def test_rename_file_rejects_directory(test_dirs):
+    """rename_file raises FileNotFoundError for a directory."""
+    test_path, _ = test_dirs
+    directory = test_path / "Some Dir"
+    directory.mkdir()
+    with pytest.raises(FileNotFoundError, match="Not a file"):
+        rename.rename_file(directory)
+
+
+def test_rename_file_dangling_symlink_target(test_dirs):
+    """A dangling symlink at the target path counts as an existing file."""
+    test_path, _ = test_dirs
+    orig = test_path / "Dangling Target.txt"
+    orig.write_text("content")
+    (test_path / "dangling-target.txt").symlink_to(test_path / "missing.txt")
+    with pytest.raises(FileExistsError):
+        rename.rename_file(orig)
+    assert orig.exists()
+
+
 def test_rename_file_success(test_dirs, test_files):
     """Test successful file renaming operations."""
     test_path, target_dir = test_dirs
@@ -215,12 +308,25 @@ def test_safe_stem_already_safe():
     assert rename.safe_stem("alreadySafe", style=Style.camel) == "alreadysafe"
 
 
+def test_safe_stem_nearly_safe():
+    """Lowercase input with stray delimiters is still cleaned up."""
+    assert rename.safe_stem("-already--safe-") == "already-safe"
+    assert rename.safe_stem("_already_safe_") == "_already_safe"
+    assert rename.safe_stem("already_safe-", style=Style.snake) == "already_safe"
+    assert rename.safe_stem("already_safe", style=Style.kebab) == "already-safe"
+
+
 def test_safe_stem_mixed_unicode_whitespace():
     """Mix of Unicode whitespace types all normalized."""
     # tab + no-break space + narrow no-break space
     assert rename.safe_stem("a\tb\u00a0c\u202fd") == "a-b-c-d"
 
 
+def test_safe_stem_other_unicode_whitespace():
+    """Ideographic space, line separator and ASCII unit separator are whitespace."""
+    assert rename.safe_stem("a\u3000b\u2028c\x1fd") == "a-b-c-d"
+
+
 def test_safe_stem_tabs():
     """Tab characters are treated as whitespace."""
     assert rename.safe_stem("hello\tworld") == "hello-world"